@@ -48,7 +48,8 @@ class AssetProcessor:
                            rerun : bool = False,
                            nb_tc : int = None, 
                            significativity_tc = 0.3,
-                           save : bool = False):
+                           save : bool = False,
+                           max_workers : int = 1):
         
         """
         Visualizes the turning points (TC) for a given frequency and optimization method.
@@ -61,6 +62,8 @@ class AssetProcessor:
             nb_tc (int): The number of turning points to visualize (default is None, meaning all).
             significativity_tc (float): The significance threshold for the turning points (default is 0.3).
             save (bool): Whether to save the results as JSON files (default is False).
+            max_workers (int): Number of processes fitting the subintervals in parallel (default is 1, no pool).
+                The workers are spawned, so a calling script must be guarded by `if __name__ == "__main__":`.
         """
     
         if frequency not in ["daily", "weekly", "monthly"]:
@@ -86,7 +89,7 @@ class AssetProcessor:
                     print(f"Running process for {set_name} from {start_date} to {end_date}")
 
                     # Exécute le processus d'optimisation pour l'intervalle de dates donné
-                    results = fw.process(start_date, end_date, optimizer)
+                    results = fw.process(start_date, end_date, optimizer, max_workers=max_workers)
                     if save:
                         # Sauvegarde des résultats au format JSON dans le fichier généré
                         fw.save_results(results, filename)
@@ -114,7 +117,8 @@ class AssetProcessor:
                                nb_tc : int = 20,
                                rerun: bool = False,
                                save: bool = False,
-                               save_plot : bool = False):
+                               save_plot : bool = False,
+                               max_workers : int = 1):
     
         """
         Compares the performance of different optimizers in predicting turning points.
@@ -127,6 +131,8 @@ class AssetProcessor:
             rerun (bool): Whether to rerun the optimization process (default is False).
             save (bool): Whether to save the results as JSON files (default is False).
             save_plot (bool): Whether to save the comparison plot (default is False).
+            max_workers (int): Number of processes fitting the subintervals in parallel (default is 1, no pool).
+                The workers are spawned, so a calling script must be guarded by `if __name__ == "__main__":`.
         """
         if frequency not in ["daily", "weekly", "monthly"]:
                 raise ValueError("The frequency must be one of 'daily', 'weekly', 'monthly'.")
@@ -150,7 +156,7 @@ class AssetProcessor:
                 
                 if rerun:
                     print(f"\nRunning process for {optimizer.__class__.__name__}")
-                    results = fw.process(start_date, end_date, optimizer)
+                    results = fw.process(start_date, end_date, optimizer, max_workers=max_workers)
                     best_results_list[optimizer.__class__.__name__] = fw.analyze(results=results,
                                                                                     significativity_tc=significativity_tc,
                                                                                     lppl_model=optimizer.lppl_model)
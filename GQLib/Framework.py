@@ -9,11 +9,58 @@ import plotly.io as pio
 import plotly.graph_objects as go
 import os
 
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import numba
+
 from .Optimizers import MPGA, PSO, SGA, SA, Optimizer
 from GQLib.LombAnalysis import LombAnalysis
 from GQLib.Models import LPPL, LPPLS
 from .enums import InputType
 
+
+def _init_worker(optimizer_cls: type) -> None:
+    """
+    Initializer of the worker processes used by Framework.process.
+    The windows are already spread over processes, so each worker runs its kernels
+    on a single Numba thread, and its kernels are loaded before the first window.
+
+    Parameters
+    ----------
+    optimizer_cls : type
+        Class of the optimizer run by the worker.
+    """
+    numba.set_num_threads(1)
+    optimizer_cls._warmup()
+
+
+def _fit_window(args: tuple) -> tuple:
+    """
+    Fit the optimizer on a single subinterval. Defined at module level so that it can be
+    sent to the worker processes of Framework.process.
+
+    Parameters
+    ----------
+    args : tuple
+        (optimizer, rng, sub_start, sub_end, sub_data), rng being the random generator
+        of the window (None for optimizers without one). The generator of the optimizer
+        is restored after the fit, so that the caller's optimizer is left unchanged.
+
+    Returns
+    -------
+    tuple
+        The best fitness value (RSS) and the corresponding parameter set.
+    """
+    optimizer, rng, sub_start, sub_end, sub_data = args
+    if rng is None:
+        return optimizer.fit(sub_start, sub_end, sub_data)
+    optimizer_rng = optimizer.rng
+    optimizer.rng = rng
+    try:
+        return optimizer.fit(sub_start, sub_end, sub_data)
+    finally:
+        optimizer.rng = optimizer_rng
+
 class Framework:
     """
     Framework for processing and analyzing financial time series using LPPL and Lomb-Scargle techniques.
@@ -112,7 +159,7 @@ class Framework:
         return data
 
 
-    def process(self, time_start: str, time_end: str, optimizer: Optimizer) -> dict:
+    def process(self, time_start: str, time_end: str, optimizer: Optimizer, max_workers: int = 1) -> dict:
         """
         Optimize LPPL parameters over multiple subintervals of the selected sample.
 
@@ -124,6 +171,11 @@ class Framework:
             End date of the main sample in "%d/%m/%Y" format.
         optimizer : Optimizer
             Optimizer instance for parameter fitting
+        max_workers : int, optional
+            Number of processes fitting the subintervals in parallel. Default is 1 (no pool).
+            None uses all the CPUs of the machine. The worker processes are spawned and re-import
+            the __main__ module, so a script calling process with max_workers != 1 must run it
+            under an `if __name__ == "__main__":` guard.
         Returns
         -------
         dict
@@ -142,9 +194,23 @@ class Framework:
 
         # Optimize parameters for each subinterval
         #for (sub_start, sub_end, sub_data) in tqdm(subintervals, desc="Processing subintervals", unit="subinterval"):
-        for sub_start, sub_end, sub_data in subintervals:
-            
-            bestObjV, bestParams = optimizer.fit(sub_start, sub_end, sub_data)
+        # One child random stream per window, spawned here so that the windows do not replay the
+        # stream of the optimizer pickled into each task, and the pool matches the serial run
+        rngs = optimizer.rng.spawn(len(subintervals)) if optimizer.rng is not None else [None] * len(subintervals)
+        window_args = [(optimizer, rng, sub_start, sub_end, sub_data)
+                       for rng, (sub_start, sub_end, sub_data) in zip(rngs, subintervals)]
+        if max_workers == 1:
+            fits = map(_fit_window, window_args)
+        else:
+            # The subintervals are independent, each worker process fits its own windows.
+            # Workers are spawned rather than forked: forking after a parallel Numba kernel has run
+            # in the parent (TBB threads) leaves the parent hung at exit. The spawned workers load
+            # the cached kernels in _init_worker.
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"),
+                                     initializer=_init_worker, initargs=(type(optimizer),)) as executor:
+                fits = list(executor.map(_fit_window, window_args))
+
+        for (sub_start, sub_end, _), (bestObjV, bestParams) in zip(subintervals, fits):
             results.append({
                 "sub_start": sub_start,
                 "sub_end": sub_end,
@@ -391,8 +457,8 @@ class Framework:
                 
             else:
                 significant_tc = [element[0] for element in significant_tc]
-        except:
-            pass
+        except Exception as e:
+            print(f"Erreur lors de la sélection des TC : {e}")
         
         index_plot = 0
         for tc in significant_tc:
@@ -410,7 +476,8 @@ class Framework:
                         )
                     )
                     index_plot += 1
-            except:
+            except (IndexError, TypeError, ValueError):
+                # tc en dehors des dates disponibles ou invalide
                 continue
         
         fig.update_layout(title=name, 
@@ -537,8 +604,8 @@ class Framework:
                 sum_max_power = sum(x[1] for x in significant_tc if x[1] is not None and not np.isnan(x[1]))
                 weighted_sum_tc = sum(x[0] * x[1] for x in significant_tc if x[1] is not None and not np.isnan(x[1]))
                 significant_tc = weighted_sum_tc / sum_max_power if sum_max_power != 0 else 0
-            except:
-                pass
+            except Exception as e:
+                print(f"Erreur lors du calcul des TC : {e}")
 
             # On plot les start et end date une fois à la première itération
             if i == 0:
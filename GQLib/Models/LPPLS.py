@@ -1,6 +1,6 @@
 import numpy as np
 from matplotlib import pyplot as plt
-from ..njitFunc import njit_RSS_LPPLS
+from ..njitFunc import njit_RSS_LPPLS, njit_calculate_fitness
 
 class LPPLS:
     """
@@ -166,4 +166,31 @@ class LPPLS:
         float
             Residual Sum of Squares (RSS) value for the given parameters and data.
         """
-        return njit_RSS_LPPLS(chromosome, data)
+        return njit_RSS_LPPLS(chromosome, data[:, 0], data[:, 1])
+
+    @staticmethod
+    def numba_RSS_batch(population: np.ndarray, data: np.ndarray) -> np.ndarray:
+        """
+        Compute the RSS of several chromosomes at once, with a single Numba call.
+
+        Parameters
+        ----------
+        population : np.ndarray
+            Array of shape (N, 3), one set of parameters [t_c, omega, alpha] per row.
+        data : np.ndarray
+            Observed data in the format [time, price].
+
+        Returns
+        -------
+        np.ndarray
+            Residual Sum of Squares (RSS) of each chromosome, shape (N,).
+
+        Raises
+        ------
+        ValueError
+            If the chromosomes do not have 3 parameters (the batch kernel selects the model
+            from the number of parameters).
+        """
+        if population.ndim != 2 or population.shape[1] != 3:
+            raise ValueError(f"LPPLS chromosomes must have 3 parameters, got population of shape {population.shape}.")
+        return njit_calculate_fitness(population, np.ascontiguousarray(data[:, 0]), np.ascontiguousarray(data[:, 1]))
@@ -78,15 +78,15 @@ class FA(Optimizer):
         else:
             raise ValueError("Invalid model type.")
         num_params = param_bounds.shape[0]
+        low = np.ascontiguousarray(param_bounds[:, 0])
+        high = np.ascontiguousarray(param_bounds[:, 1])
         self.fitness_history = []
 
-        # Initialize fireflies with initial fitness values
-        fireflies = [
-            np.array([np.random.uniform(low, high) for low, high in param_bounds])
-            for _ in range(self.NUM_FIREFLIES)
-        ]
+        # Initialize fireflies with initial fitness values, one row per firefly
+        fireflies = np.random.uniform(param_bounds[:, 0], param_bounds[:, 1],
+                                      size=(self.NUM_FIREFLIES, num_params))
         # Initialise the fitness of the fireflies
-        fitness = [self.lppl_model.numba_RSS(firefly, data) for firefly in fireflies]
+        fitness = list(self.lppl_model.numba_RSS_batch(fireflies, data))
         best_index = np.argmin(fitness)
         best_fitness = fitness[best_index]
         # Iterate through the generations
@@ -100,9 +100,7 @@ class FA(Optimizer):
                         fireflies[i] += self.beta0 * attractiveness * (fireflies[j] - fireflies[i]) + \
                             self.alpha * (np.random.rand(num_params) - 0.5)
                         # On limite les positions dans la borne
-                        for k in range(len(fireflies[i])):
-                            lower_bound, upper_bound = param_bounds[k]
-                            fireflies[i][k] = max(lower_bound, min(fireflies[i][k], upper_bound))
+                        np.clip(fireflies[i], low, high, out=fireflies[i])
                         fitness[i] = self.lppl_model.numba_RSS(fireflies[i], data)
 
                         # Update du meilleur firefly
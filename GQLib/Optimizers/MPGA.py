@@ -1,11 +1,13 @@
 from typing import Tuple
 import numpy as np
+from numba.typed import List
 from ..Models import LPPL, LPPLS
-from .abstract_optimizer import GeneticAlgorithm
+from .abstract_optimizer import GeneticAlgorithm, _warmup_inputs
 from ..Models import LPPL, LPPLS
 from GQLib.njitFunc import (
-
-    njit_immigration_operation
+    njit_calculate_fitness,
+    njit_initialize_population,
+    njit_step_all
 )
 
 class MPGA(GeneticAlgorithm):
@@ -14,19 +16,45 @@ class MPGA(GeneticAlgorithm):
 
     This optimizer evolves multiple populations through selection, crossover, mutation,
     and immigration operations to minimize the Residual Sum of Squares (RSS).
+
+    The evolution stops after STOP_GEN generations without improvement, after MAX_GEN generations,
+    or once the populations have converged: the mean fitness stays within CONVERGENCE_TOL (relative)
+    of the best fitness for CONVERGENCE_GEN consecutive generations.
     """
 
-    def __init__(self, lppl_model: 'LPPL | LPPLS' = LPPL) -> None:
+    def __init__(self, lppl_model: 'LPPL | LPPLS' = LPPL, seed: int = None) -> None:
         """
         Initialize the MPGA optimizer.
         lppl_model : 'LPPL | LPPLS'
             Log Periodic Power Law Model to optimized
+        seed : int, optional
+            Seed of the random generator, for reproducible fits. Each population draws its
+            random numbers from its own stream, spawned from this seed. Framework.process
+            fits each subinterval with its own child stream.
         """
         self.lppl_model = lppl_model
+        self.rng = np.random.default_rng(seed)
         self.NUM_POPULATIONS = None
         self.POPULATION_SIZE = None
         self.MAX_GEN = None
         self.STOP_GEN = None
+        self.CONVERGENCE_TOL = 0.01
+        self.CONVERGENCE_GEN = 3
+
+    @classmethod
+    def _warmup(cls) -> None:
+        """
+        Compile the genetic operators, the fitness kernel and the immigration operation.
+        """
+        super()._warmup()
+        for lppl_model in (LPPL, LPPLS):
+            param_bounds, t, y = _warmup_inputs(lppl_model)
+            populations = np.stack([njit_initialize_population(param_bounds, 2) for _ in range(2)])
+            fitness_values = np.stack([njit_calculate_fitness(pop, t, y) for pop in populations])
+            probs = np.full(2, 0.5)
+            rngs = List(np.random.default_rng(0).spawn(2))
+            njit_step_all(populations, fitness_values, probs, probs, param_bounds, t, y,
+                          np.empty_like(populations), np.empty_like(fitness_values), True, rngs)
 
     def fit(self, start: int, end: int, data: np.ndarray) -> Tuple[float, np.ndarray]:
         """
@@ -54,95 +82,106 @@ class MPGA(GeneticAlgorithm):
         elif self.lppl_model == LPPLS:
             param_bounds = self.convert_param_bounds_lppls(end)
         self.fitness_history = [[] for _ in range(self.NUM_POPULATIONS)]
+        t, y = self.split_data(data)
+        # One independent random stream per population
+        rngs = self.rng.spawn(self.NUM_POPULATIONS)
         # Generate random probabilities for crossover and mutation
-        crossover_prob = np.random.uniform(0.001, 0.05, size=self.NUM_POPULATIONS)
-        mutation_prob = np.random.uniform(0.001, 0.05, size=self.NUM_POPULATIONS)
-
-        # Initialize populations for all subintervals
-        populations = [
-            self.initialize_population(param_bounds, self.POPULATION_SIZE)
-            for _ in range(self.NUM_POPULATIONS)
-        ]
-
-        # Compute initial fitness values
-        fitness_values = []
-        bestObjV = np.inf
-        bestChrom = None
-
+        crossover_prob = np.array([rng.uniform(0.001, 0.05) for rng in rngs])
+        mutation_prob = np.array([rng.uniform(0.001, 0.05) for rng in rngs])
+
+        # Populations and fitness live in preallocated (M, N, D) and (M, N) buffers,
+        # updated in place at each generation
+        num_params = param_bounds.shape[0]
+        populations = np.empty((self.NUM_POPULATIONS, self.POPULATION_SIZE, num_params), dtype=t.dtype)
+        fitness_values = np.empty((self.NUM_POPULATIONS, self.POPULATION_SIZE))
+        offspring = np.empty_like(populations)
+        offspring_fitness = np.empty_like(fitness_values)
+
+        # Initialize populations and compute initial fitness values
         for m in range(self.NUM_POPULATIONS):
-            fit = self.calculate_fitness(populations[m], data, self.lppl_model)
-            fitness_values.append(fit)
-            local_min = np.min(fit)
-
-            if local_min < bestObjV:
-                bestObjV = local_min
-                bestChrom = populations[m][np.argmin(fit)]
-        self.fitness_history[m].append(bestObjV)
+            populations[m] = rngs[m].uniform(param_bounds[:, 0], param_bounds[:, 1],
+                                             size=(self.POPULATION_SIZE, num_params))
+            fitness_values[m] = self.calculate_fitness(populations[m], t, y)
+        # The streams are handed to the kernel as a typed list, advanced in place at each generation
+        rngs = List(rngs)
+
+        # Determine initial best individual over all populations with a single argmin
+        # (copied into its own buffer, since the populations are overwritten by the next generations)
+        best_idx = int(np.argmin(fitness_values))
+        m, i = divmod(best_idx, self.POPULATION_SIZE)
+        bestObjV = fitness_values[m, i]
+        bestChrom = np.empty(num_params, dtype=populations.dtype)
+        np.copyto(bestChrom, populations[m, i])
+        self.fitness_history[-1].append(bestObjV)
 
         # Initialize loop counters
         gen = 1
         gen0 = 0
+        converged_gen = 0
 
         # MPGA Evolution Loop
-        while gen0 < self.STOP_GEN and gen <= self.MAX_GEN:
-            new_populations = []
-
-            for m in range(self.NUM_POPULATIONS):
-                fit = fitness_values[m]
-                selected = self.selection(populations[m], fit)
-                offspring = self.crossover(selected, crossover_prob[m])
-                mutated = self.mutate(offspring, mutation_prob[m], param_bounds)
-                new_populations.append(mutated)
-
-            # Immigration operation
-            populations = self.immigration_operation(new_populations, fitness_values)
-
-            # Recompute fitness values
-            fitness_values = []
-            for m in range(self.NUM_POPULATIONS):
-                fit = np.array([self.lppl_model.numba_RSS(ch, data) for ch in populations[m]])
-                fitness_values.append(fit)
+        while gen0 < self.STOP_GEN and gen <= self.MAX_GEN and converged_gen < self.CONVERGENCE_GEN:
+            # Selection, crossover, mutation, fitness and immigration of all populations,
+            # each population drawing from its own stream
+            self.evolve_populations(populations, fitness_values, crossover_prob, mutation_prob,
+                                    param_bounds, t, y, offspring, offspring_fitness, rngs)
 
             # Check for global best solution
-            newbestObjV = np.inf
-            newbestChrom = None
-
-            for m in range(self.NUM_POPULATIONS):
-                local_min = np.min(fitness_values[m])
-
-                if local_min < newbestObjV:
-                    newbestObjV = local_min
-                    newbestChrom = populations[m][np.argmin(fitness_values[m])]
-            self.fitness_history[m].append(newbestObjV)
+            best_idx = int(np.argmin(fitness_values))
+            m, i = divmod(best_idx, self.POPULATION_SIZE)
+            newbestObjV = fitness_values[m, i]
+            self.fitness_history[-1].append(newbestObjV)
 
             # Update counters based on improvement
             if newbestObjV < bestObjV:
                 bestObjV = newbestObjV
-                bestChrom = newbestChrom
+                np.copyto(bestChrom, populations[m, i])
                 gen0 = 0
             else:
                 gen0 += 1
 
+            # Convergence of the populations: mean fitness (singular individuals excluded) close to the best
+            finite_fitness = fitness_values[np.isfinite(fitness_values)]
+            if finite_fitness.size and finite_fitness.mean() - newbestObjV <= self.CONVERGENCE_TOL * abs(newbestObjV):
+                converged_gen += 1
+            else:
+                converged_gen = 0
+
             gen += 1
 
-        return bestObjV, bestChrom
+        return self._final_rss(bestObjV, bestChrom, data)
 
-    def immigration_operation(self, populations: list[np.ndarray], fitness_values: list[np.ndarray]) -> list[np.ndarray]:
+    def evolve_populations(self, populations: np.ndarray, fitness_values: np.ndarray,
+                           crossover_prob: np.ndarray, mutation_prob: np.ndarray, param_bounds: np.ndarray,
+                           t: np.ndarray, y: np.ndarray, offspring: np.ndarray,
+                           offspring_fitness: np.ndarray, rngs: List) -> None:
         """
-        Perform the immigration operation between populations.
+        Run one generation of every population in place: selection, crossover, mutation,
+        fitness evaluation and immigration.
+        With CACHE_FITNESS, only the offspring modified by crossover or mutation are re-evaluated.
 
         Parameters
         ----------
-        populations : list of np.ndarray
-            List of populations, one per subinterval.
-        fitness_values : list of np.ndarray
-            List of fitness values for each population.
-
-        Returns
-        -------
-        list of np.ndarray
-            Updated populations after immigration.
+        populations : np.ndarray
+            Populations array of shape (M, N, 4).
+        fitness_values : np.ndarray
+            Fitness values of each population, shape (M, N).
+        crossover_prob : np.ndarray
+            Crossover probability of each population, shape (M,).
+        mutation_prob : np.ndarray
+            Mutation probability of each population, shape (M,).
+        param_bounds : np.ndarray
+            Bounds for each parameter.
+        t : np.ndarray
+            Contiguous time points of the subinterval, shape (J,).
+        y : np.ndarray
+            Contiguous observed values of the subinterval, shape (J,).
+        offspring : np.ndarray
+            Scratch buffer of the same shape as populations.
+        offspring_fitness : np.ndarray
+            Scratch buffer of the same shape as fitness_values.
+        rngs : numba.typed.List
+            Random generator of each population, length M.
         """
-        return njit_immigration_operation(populations, fitness_values)
-
-    
\ No newline at end of file
+        njit_step_all(populations, fitness_values, crossover_prob, mutation_prob, param_bounds, t, y,
+                      offspring, offspring_fitness, self.CACHE_FITNESS, rngs)
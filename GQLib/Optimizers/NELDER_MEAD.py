@@ -25,22 +25,21 @@ class NELDER_MEAD(Optimizer):
         else:
             raise ValueError("Invalid model type.")
 
+        # Lower bounds and widths as contiguous vectors, shared by the transformations
+        low = np.ascontiguousarray(param_bounds[:, 0])
+        high = np.ascontiguousarray(param_bounds[:, 1])
+        width = high - low
+
         def objective_function(params):
             return self.lppl_model.numba_RSS(params, data)
 
         def transform_params(params):
             # Transformation pour s'assurer que les paramètres restent dans les bornes
-            transformed = np.empty_like(params)
-            for i, (low, high) in enumerate(param_bounds):
-                transformed[i] = low + (high - low) / (1 + np.exp(-params[i]))
-            return transformed
+            return low + width / (1 + np.exp(-params))
 
         def inverse_transform_params(params):
             # Transformation inverse pour revenir à l'espace des paramètres d'origine
-            inverse_transformed = np.empty_like(params)
-            for i, (low, high) in enumerate(param_bounds):
-                inverse_transformed[i] = np.log((params[i] - low) / (high - params[i]))
-            return inverse_transformed
+            return np.log((params - low) / (high - params))
 
         initial_guess = np.mean(param_bounds, axis=1)
         transformed_initial_guess = inverse_transform_params(initial_guess)
@@ -1,8 +1,8 @@
 from typing import Tuple
 import numpy as np
-import random
 from GQLib.Models import LPPL, LPPLS
-from .abstract_optimizer import Optimizer
+from .abstract_optimizer import Optimizer, _warmup_inputs
+from ..njitFunc import njit_simulated_annealing
 
 class SA(Optimizer):
     """
@@ -30,6 +30,8 @@ class SA(Optimizer):
         The initial temperature for the SA algorithm.
     COOLING_RATE : float
         The rate at which the temperature decreases during the algorithm.
+
+    FLOAT32_FITNESS is ignored: the annealing kernel works on a single candidate in float64.
     """
 
     def __init__(self, lppl_model: 'LPPL | LPPLS' = LPPL) -> None:
@@ -53,6 +55,16 @@ class SA(Optimizer):
         self.COOLING_RATE = None
     
 
+    @classmethod
+    def _warmup(cls) -> None:
+        """
+        Compile the annealing kernel for both models.
+        """
+        super()._warmup()
+        for lppl_model in (LPPL, LPPLS):
+            param_bounds, t, y = _warmup_inputs(lppl_model)
+            njit_simulated_annealing(param_bounds, t, y, 0, 1.0, 0.5)
+
     def fit(self, start: int, end: int, data: np.ndarray) -> Tuple[float, np.ndarray]:
         """
         Fit the LPPL model parameters to the data using Simulated Annealing (SA) optimization.
@@ -88,44 +100,11 @@ class SA(Optimizer):
         else:
             raise ValueError("Invalid model type.")
 
-        self.fitness_history = []
-        # Initialize the current solution randomly within parameter bounds
-        current_solution = [np.random.uniform(low, high) for (low, high) in param_bounds]
-        best_solution = current_solution[:]
-        current_fitness = self.lppl_model.numba_RSS(current_solution, data)
-        best_fitness = current_fitness
-        self.fitness_history.append(current_fitness)
-
-        # Temperature initialization
-        temperature = self.INITIAL_TEMP
-        candidate_solution = np.empty_like(current_solution)
-
-        current = 0
-        while current <= self.MAX_ITER:
-            # Generate a new candidate solution by making small perturbations
-            for i in range(len(current_solution)):
-                perturbation = np.random.normal(0, scale=0.1 * (param_bounds[i][1] - param_bounds[i][0]))
-                candidate_solution[i] = np.clip(current_solution[i] + perturbation, *param_bounds[i])
-
-            # Evaluate the fitness of the candidate solution
-            candidate_fitness = self.lppl_model.numba_RSS(candidate_solution, data)
-
-            # Acceptance probability
-            delta = candidate_fitness - current_fitness
-            if candidate_fitness < current_fitness or random.random() < np.exp(-delta / temperature):
-                current_solution = candidate_solution.copy()
-                current_fitness = candidate_fitness
-                self.fitness_history.append(current_fitness)
-
-            # Track the best solution
-            if current_fitness < best_fitness:
-                best_solution = current_solution
-                best_fitness = current_fitness
-                current = 0
-
-            current += 1
-
-            # Cooling schedule: Gradually reduce the temperature
-            temperature *= self.COOLING_RATE
-
-        return best_fitness, np.array(best_solution)
\ No newline at end of file
+        t, y = self.split_data(data, np.float64)
+
+        # The whole annealing loop runs in nopython mode
+        best_fitness, best_solution, history = njit_simulated_annealing(
+            param_bounds, t, y, self.MAX_ITER, float(self.INITIAL_TEMP), self.COOLING_RATE)
+        self.fitness_history = list(history)
+
+        return best_fitness, best_solution
\ No newline at end of file
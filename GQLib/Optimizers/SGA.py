@@ -1,7 +1,7 @@
 from typing import Tuple
 import numpy as np
 from GQLib.Models import LPPL, LPPLS
-from .abstract_optimizer import Optimizer, GeneticAlgorithm
+from .abstract_optimizer import GeneticAlgorithm
 
 
 class SGA(GeneticAlgorithm):
@@ -11,11 +11,17 @@ class SGA(GeneticAlgorithm):
     This optimizer evolves a single population through selection, crossover, mutation to minimize the Residual Sum of Squares (RSS).
     """
 
-    def __init__(self, lppl_model: 'LPPL | LPPLS' = LPPL) -> None:
+    def __init__(self, lppl_model: 'LPPL | LPPLS' = LPPL, seed: int = None) -> None:
         """
         Initialize the SGA optimizer.
+        lppl_model : 'LPPL | LPPLS'
+            Log Periodic Power Law Model to optimized
+        seed : int, optional
+            Seed of the random generator, for reproducible fits. Framework.process
+            fits each subinterval with its own child stream spawned from it.
         """
         self.lppl_model = lppl_model
+        self.rng = np.random.default_rng(seed)
 
         self.POPULATION_SIZE = None
         self.MAX_GEN = None
@@ -51,22 +57,30 @@ class SGA(GeneticAlgorithm):
             raise ValueError("Invalid model type.")
 
         self.fitness_history = []
+        t, y = self.split_data(data)
 
         # Generate random probabilities for crossover and mutation
-        crossover_prob = np.random.uniform(0.001, 0.05)
-        mutation_prob = np.random.uniform(0.001, 0.05)
+        crossover_prob = self.rng.uniform(0.001, 0.05)
+        mutation_prob = self.rng.uniform(0.001, 0.05)
 
         # Initialize populations for all subintervals
-        population = self.initialize_population(param_bounds, self.POPULATION_SIZE)
+        population = self.rng.uniform(param_bounds[:, 0], param_bounds[:, 1],
+                                      size=(self.POPULATION_SIZE, param_bounds.shape[0])).astype(t.dtype, copy=False)
 
         # Compute initial fitness values
-        fitness = self.calculate_fitness(population, data, self.lppl_model)
+        fitness = self.calculate_fitness(population, t, y)
 
         # Determine initial best individual
-        bestObjV = np.min(fitness)
-        bestChrom = population[np.argmin(fitness)]
+        best_idx = int(np.argmin(fitness))
+        bestObjV = fitness[best_idx]
+        bestChrom = np.empty(population.shape[1], dtype=population.dtype)
+        np.copyto(bestChrom, population[best_idx])
         self.fitness_history.append(bestObjV)
 
+        # Offspring buffers, swapped with the population at each generation
+        offspring = np.empty_like(population)
+        offspring_fitness = np.empty_like(fitness)
+
         # Initialize loop counters
         gen = 1
         gen0 = 0
@@ -75,30 +89,33 @@ class SGA(GeneticAlgorithm):
         while gen0 < self.STOP_GEN and gen <= self.MAX_GEN:
 
             # Perform selection, crossover and mutation
-            selected = self.selection(population, fitness)
-            offspring = self.crossover(selected, crossover_prob)
-            mutated = self.mutate(offspring, mutation_prob, param_bounds)
+            self.evolve(population, fitness, crossover_prob, mutation_prob, param_bounds,
+                        offspring=offspring, offspring_fitness=offspring_fitness)
 
-            # Update population
-            population = mutated
+            # Recompute fitness values (only for the modified offspring when CACHE_FITNESS)
+            if self.CACHE_FITNESS:
+                self.update_fitness(offspring, offspring_fitness, t, y)
+            else:
+                offspring_fitness[:] = self.calculate_fitness(offspring, t, y)
 
-            # Recompute fitness values
-            fitness = self.calculate_fitness(population, data, self.lppl_model)
+            # The offspring become the population
+            population, offspring = offspring, population
+            fitness, offspring_fitness = offspring_fitness, fitness
             
             # Determine best individual
-            newbestObjV = np.min(fitness)
-            newbestChrom = population[np.argmin(fitness)]
+            best_idx = int(np.argmin(fitness))
+            newbestObjV = fitness[best_idx]
             self.fitness_history.append(newbestObjV)
 
             # Update best solution
             if newbestObjV < bestObjV:
                 bestObjV = newbestObjV
-                bestChrom = newbestChrom
+                np.copyto(bestChrom, population[best_idx])
                 gen0 = 0
             else:
                 gen0 += 1
             
             gen += 1
 
-        return bestObjV, bestChrom
+        return self._final_rss(bestObjV, bestChrom, data)
 
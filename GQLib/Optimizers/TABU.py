@@ -76,15 +76,14 @@ class TABU(Optimizer):
             # Generate neighborhood solutions
             neighborhood = self.generate_neighborhood(current_solution, param_bounds)
 
-            # Evaluate neighbors and select the best non-tabu solution
+            # Evaluate neighbors in one batch and select the best non-tabu solution
             best_neighbor = None
             best_neighbor_fitness = float('inf')
-            for neighbor in neighborhood:
-                if neighbor.tolist() not in self.tabu_list:
-                    fitness = self.compute_fitness(neighbor, data)
-                    if fitness < best_neighbor_fitness:
-                        best_neighbor = neighbor
-                        best_neighbor_fitness = fitness
+            fitness = self.lppl_model.numba_RSS_batch(neighborhood, data)
+            for k, neighbor in enumerate(neighborhood):
+                if fitness[k] < best_neighbor_fitness and neighbor.tolist() not in self.tabu_list:
+                    best_neighbor = neighbor
+                    best_neighbor_fitness = fitness[k]
 
             # Update the tabu list
             self.tabu_list.append(current_solution.tolist())
@@ -117,7 +116,7 @@ class TABU(Optimizer):
         np.ndarray
             A randomly initialized solution.
         """
-        return np.array([np.random.uniform(low, high) for low, high in param_bounds])
+        return np.random.uniform(param_bounds[:, 0], param_bounds[:, 1])
 
     def compute_fitness(self, solution: np.ndarray, data: np.ndarray) -> float:
         """
@@ -151,13 +150,8 @@ class TABU(Optimizer):
         Returns
         -------
         np.ndarray
-            A list of neighboring solutions.
+            Neighboring solutions, one per row, shape (NEIGHBORHOOD_SIZE, D).
         """
-        neighborhood = []
-        for _ in range(self.NEIGHBORHOOD_SIZE):
-            neighbor = solution.copy()
-            for i in range(len(solution)):
-                perturbation = np.random.uniform(-0.1, 0.1) * (param_bounds[i][1] - param_bounds[i][0])
-                neighbor[i] = np.clip(neighbor[i] + perturbation, param_bounds[i][0], param_bounds[i][1])
-            neighborhood.append(neighbor)
-        return neighborhood
\ No newline at end of file
+        low, high = param_bounds[:, 0], param_bounds[:, 1]
+        perturbations = np.random.uniform(-0.1, 0.1, size=(self.NEIGHBORHOOD_SIZE, len(solution))) * (high - low)
+        return np.clip(solution + perturbations, low, high)
\ No newline at end of file
@@ -3,24 +3,77 @@ from typing import Tuple
 import numpy as np
 import plotly.graph_objects as go
 import json
+from functools import lru_cache
 from GQLib.njitFunc import (
     njit_calculate_fitness,
     njit_selection,
     njit_crossover,
     njit_mutate,
+    njit_ga_step,
     njit_initialize_population,
+    njit_update_fitness,
 )
 from ..Models import LPPL, LPPLS
 
+
+@lru_cache(maxsize=16)
+def _load_params(path: str) -> dict:
+    """
+    Parse a JSON parameter file once, and share the result between optimizer instances.
+    The returned dict is shared and must not be modified.
+
+    Parameters
+    ----------
+    path : str
+        Path to the JSON parameter file.
+
+    Returns
+    -------
+    dict
+        The parsed parameters.
+    """
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _warmup_inputs(lppl_model: 'LPPL | LPPLS') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build tiny inputs with the same types as a real fit, used to trigger the JIT compilation.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Parameter bounds of shape (D, 2), read-only like the bounds of a real fit,
+        and the t, y series of shape (2,).
+    """
+    num_params = 4 if lppl_model == LPPL else 3
+    param_bounds = np.tile(np.array([2.0, 3.0]), (num_params, 1))
+    param_bounds.setflags(write=False)
+    t = np.array([0.0, 1.0])
+    y = np.array([0.0, 1.0])
+    return param_bounds, t, y
+
 class Optimizer(ABC):
     """
     Abstract base class for optimizers.
 
     Defines the interface for any optimizer used to fit LPPL parameters.
+
+    Attributes
+    ----------
+    FLOAT32_FITNESS : bool
+        If True, optimizers supporting it (MPGA, SGA, PSO) store their candidates and the series in
+        float32 during the fit, which is faster but only accurate enough to rank candidates. The RSS
+        of the best solution is then recomputed in float64. Default is False.
+    rng : np.random.Generator or None
+        Random generator of the optimizers drawing from a seeded stream. Framework.process
+        gives each subinterval its own child stream spawned from it.
     """
 
     PARAM_BOUNDS = None
     lppl_model = None
+    rng = None
+    FLOAT32_FITNESS = False
     @abstractmethod
     def __init__(self) -> None:
         pass
@@ -47,6 +100,21 @@ class Optimizer(ABC):
         self.fitness_history = []
         pass
 
+    @classmethod
+    def _warmup(cls) -> None:
+        """
+        Call the njit kernels of the optimizer on dummy inputs, so that they are compiled
+        (or loaded from the Numba cache) before the first call to fit().
+        The base implementation covers the RSS of both models, as called through
+        numba_RSS and numba_RSS_batch on a (J, 2) data array.
+        """
+        data = np.array([[0.0, 0.0], [1.0, 1.0]])
+        for lppl_model in (LPPL, LPPLS):
+            param_bounds, _, _ = _warmup_inputs(lppl_model)
+            population = param_bounds.T.copy()
+            lppl_model.numba_RSS(population[0], data)
+            lppl_model.numba_RSS_batch(population, data)
+
     
     def visualize_convergence(self):
         """
@@ -96,21 +164,67 @@ class Optimizer(ABC):
 
         """
         try:
-            with open(f"params/params_{optimizer_name.lower()}.json", "r") as f:
-                params = json.load(f)
+            params = _load_params(f"params/params_{optimizer_name.lower()}.json")
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file for {optimizer_name} not found.")
 
         # Charger les paramètres liés à la fréquence
         freq_key = f"{frequency.upper()}_PARAM_BOUNDS"
         if freq_key in params:
-            self.PARAM_BOUNDS = params[freq_key]
+            # Bounds converted to arrays once, in a dict owned by the instance (params is shared)
+            self.PARAM_BOUNDS = {name: np.asarray(bounds, dtype=np.float64)
+                                 for name, bounds in params[freq_key].items()}
+            self._param_bounds_cache = {}
 
         # Créer dynamiquement des attributs pour les autres paramètres globaux
         for key, value in params.items():
             if key != freq_key:
                 setattr(self, key, value)
 
+    def split_data(self, data: np.ndarray, dtype: type = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Extract contiguous copies of the time and price columns, in the precision used for the fitness.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            Subinterval data, shape (J, 2).
+        dtype : type, optional
+            Precision of the copies. If None, float32 if FLOAT32_FITNESS else float64.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            t and y, each of shape (J,).
+        """
+        if dtype is None:
+            dtype = np.float32 if self.FLOAT32_FITNESS else np.float64
+        return np.ascontiguousarray(data[:, 0], dtype=dtype), np.ascontiguousarray(data[:, 1], dtype=dtype)
+
+    def _final_rss(self, best_fitness: float, best: np.ndarray, data: np.ndarray) -> Tuple[float, np.ndarray]:
+        """
+        Fitness and parameters reported for the best solution of a fit. With FLOAT32_FITNESS the
+        fitness was only used for ranking, so the RSS of the best solution is recomputed in float64.
+
+        Parameters
+        ----------
+        best_fitness : float
+            Fitness of the best solution, as computed during the fit.
+        best : np.ndarray
+            Best solution, shape (D,).
+        data : np.ndarray
+            Subinterval data, shape (J, 2).
+
+        Returns
+        -------
+        Tuple[float, np.ndarray]
+            The RSS and the parameters of the best solution, in float64.
+        """
+        if not self.FLOAT32_FITNESS:
+            return best_fitness, best
+        best = best.astype(np.float64)
+        return self.lppl_model.numba_RSS(best, data), best
+
     def convert_param_bounds_lppls(self, end: float) -> np.ndarray:
         """
         Convert parameter bounds to a NumPy array format.
@@ -125,11 +239,7 @@ class Optimizer(ABC):
         np.ndarray
             A 2D array of shape (3, 2) representing the bounds for each parameter.
         """
-        return np.array([
-            [self.PARAM_BOUNDS["t_c"][0] + end,    self.PARAM_BOUNDS["t_c"][1] + end],
-            [self.PARAM_BOUNDS["omega"][0],       self.PARAM_BOUNDS["omega"][1]],
-            [self.PARAM_BOUNDS["alpha"][0],       self.PARAM_BOUNDS["alpha"][1]]
-        ], dtype=np.float64)
+        return self._param_bounds(("t_c", "omega", "alpha"), end)
     
     def convert_param_bounds_lppl(self, end: float) -> np.ndarray:
         """
@@ -145,12 +255,36 @@ class Optimizer(ABC):
         np.ndarray
             A 2D array of shape (4, 2) representing the bounds for each parameter.
         """
-        return np.array([
-            [self.PARAM_BOUNDS["t_c"][0] + end,    self.PARAM_BOUNDS["t_c"][1] + end],
-            [self.PARAM_BOUNDS["omega"][0],       self.PARAM_BOUNDS["omega"][1]],
-            [self.PARAM_BOUNDS["phi"][0],         self.PARAM_BOUNDS["phi"][1]],
-            [self.PARAM_BOUNDS["alpha"][0],       self.PARAM_BOUNDS["alpha"][1]]
-        ], dtype=np.float64)
+        return self._param_bounds(("t_c", "omega", "phi", "alpha"), end)
+
+    def _param_bounds(self, names: Tuple[str, ...], end: float) -> np.ndarray:
+        """
+        Build the bounds of the given parameters, t_c being shifted by the end of the subinterval.
+        Sliding windows share few distinct ends, so the arrays are cached per (names, end) and per
+        value of the configured bounds, so that a direct assignment of PARAM_BOUNDS is picked up.
+        The cached arrays are shared between fits and returned read-only.
+
+        Parameters
+        ----------
+        names : Tuple[str, ...]
+            Names of the parameters, in the order of the chromosome.
+        end : float
+            The end time of the subinterval.
+
+        Returns
+        -------
+        np.ndarray
+            A read-only 2D array of shape (D, 2) representing the bounds for each parameter.
+        """
+        cache = self.__dict__.setdefault("_param_bounds_cache", {})
+        key = (names, end, tuple(tuple(np.ravel(self.PARAM_BOUNDS[name]).tolist()) for name in names))
+        bounds = cache.get(key)
+        if bounds is None:
+            bounds = np.stack([self.PARAM_BOUNDS[name] for name in names]).astype(np.float64)
+            bounds[0] += end
+            bounds.setflags(write=False)
+            cache[key] = bounds
+        return bounds
 
 class GeneticAlgorithm(Optimizer):
     """
@@ -160,8 +294,35 @@ class GeneticAlgorithm(Optimizer):
         - Population initialization
         - Population fitness
         - Process of : selection, mutation and crossover
+
+    Attributes
+    ----------
+    CACHE_FITNESS : bool
+        If True, offspring left unchanged by crossover and mutation keep the fitness of their
+        parent instead of being re-evaluated. The RSS is deterministic, so results are identical.
+        Default is True.
     """
+
+    CACHE_FITNESS = True
     
+    @classmethod
+    def _warmup(cls) -> None:
+        """
+        Compile the genetic operators and the fitness kernel for both models.
+        """
+        super()._warmup()
+        for lppl_model in (LPPL, LPPLS):
+            param_bounds, t, y = _warmup_inputs(lppl_model)
+            population = njit_initialize_population(param_bounds, 2)
+            fitness = njit_calculate_fitness(population, t, y)
+            selected = njit_selection(population, fitness, np.empty_like(population))
+            offspring = njit_crossover(selected, 0.5)
+            njit_mutate(offspring, 0.5, param_bounds)
+            offspring_fitness = np.empty_like(fitness)
+            njit_ga_step(population, fitness, 0.5, 0.5, param_bounds, np.empty_like(population), offspring_fitness,
+                         np.random.default_rng(0))
+            njit_update_fitness(population, offspring_fitness, t, y)
+
     def initialize_population(self, param_bounds: np.ndarray, population_size: int) -> np.ndarray:
         """
         Initialize a population of chromosomes.
@@ -180,25 +341,50 @@ class GeneticAlgorithm(Optimizer):
         """
         return njit_initialize_population(param_bounds, population_size)
 
-    def calculate_fitness(self, population: np.ndarray, data: np.ndarray, lppl_model: 'LPPL | LPPLS' = LPPL ) -> np.ndarray:
+    def calculate_fitness(self, population: np.ndarray, t: np.ndarray, y: np.ndarray) -> np.ndarray:
         """
         Calculate the RSS fitness for each individual in the population.
+        The model (LPPL or LPPLS) is given by the number of columns of the population.
 
         Parameters
         ----------
         population : np.ndarray
             Population array, shape (N, 4).
-        data : np.ndarray
-            Subinterval data, shape (J, 2).
+        t : np.ndarray
+            Contiguous time points of the subinterval, shape (J,).
+        y : np.ndarray
+            Contiguous observed values of the subinterval, shape (J,).
 
         Returns
         -------
         np.ndarray
             RSS fitness values for the population.
         """
-        return njit_calculate_fitness(population, data, lppl_model)
+        return njit_calculate_fitness(population, t, y)
+
+    def update_fitness(self, population: np.ndarray, fitness: np.ndarray, t: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Calculate, in place, the RSS fitness of the individuals whose fitness is NaN.
+
+        Parameters
+        ----------
+        population : np.ndarray
+            Population array, shape (N, 4).
+        fitness : np.ndarray
+            Fitness array of shape (N,), as filled by evolve().
+        t : np.ndarray
+            Contiguous time points of the subinterval, shape (J,).
+        y : np.ndarray
+            Contiguous observed values of the subinterval, shape (J,).
+
+        Returns
+        -------
+        np.ndarray
+            The updated fitness array.
+        """
+        return njit_update_fitness(population, fitness, t, y)
     
-    def selection(self, population: np.ndarray, fitness: np.ndarray) -> np.ndarray:
+    def selection(self, population: np.ndarray, fitness: np.ndarray, out: np.ndarray = None) -> np.ndarray:
         """
         Perform tournament selection.
 
@@ -208,13 +394,18 @@ class GeneticAlgorithm(Optimizer):
             Population array of shape (N, 4).
         fitness : np.ndarray
             Fitness array of shape (N,).
+        out : np.ndarray, optional
+            Preallocated output buffer of the same shape as the population.
+            A new array is allocated if None.
 
         Returns
         -------
         np.ndarray
             Selected individuals for the next generation.
         """
-        return njit_selection(population, fitness)
+        if out is None:
+            out = np.empty_like(population)
+        return njit_selection(population, fitness, out)
 
     def crossover(self, parents: np.ndarray, prob: float) -> np.ndarray:
         """
@@ -254,14 +445,45 @@ class GeneticAlgorithm(Optimizer):
         """
         return njit_mutate(offspring, prob, param_bounds)
 
+    def evolve(self, population: np.ndarray, fitness: np.ndarray, crossover_prob: float,
+               mutation_prob: float, param_bounds: np.ndarray, offspring: np.ndarray = None,
+               offspring_fitness: np.ndarray = None, rng: np.random.Generator = None) -> np.ndarray:
+        """
+        Produce the next generation: selection, crossover and mutation in a single pass.
 
+        Parameters
+        ----------
+        population : np.ndarray
+            Population array of shape (N, 4).
+        fitness : np.ndarray
+            Fitness array of shape (N,).
+        crossover_prob : float
+            Probability of crossover.
+        mutation_prob : float
+            Mutation probability.
+        param_bounds : np.ndarray
+            Bounds for each parameter.
+        offspring : np.ndarray, optional
+            Preallocated output buffer of the same shape as the population.
+            A new array is allocated if None.
+        offspring_fitness : np.ndarray, optional
+            Preallocated output buffer of shape (N,), filled with the fitness inherited from the
+            parents (NaN for the offspring modified by crossover or mutation).
+            A new array is allocated if None.
+        rng : np.random.Generator, optional
+            Random generator of the operators. The generator of the optimizer is used if None,
+            or a fresh unseeded one if the optimizer has none.
 
-
-
-    
-
-    
-
-   
-
-
+        Returns
+        -------
+        np.ndarray
+            Offspring population.
+        """
+        if offspring is None:
+            offspring = np.empty_like(population)
+        if offspring_fitness is None:
+            offspring_fitness = np.empty_like(fitness)
+        if rng is None:
+            rng = self.rng if self.rng is not None else np.random.default_rng()
+        return njit_ga_step(population, fitness, crossover_prob, mutation_prob, param_bounds,
+                            offspring, offspring_fitness, rng)
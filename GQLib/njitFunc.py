@@ -1,13 +1,10 @@
+import math
 import numpy as np
-from numba import njit
-from typing import TYPE_CHECKING
+from numba import njit, prange
 import warnings
 warnings.filterwarnings("ignore")
 
-if TYPE_CHECKING:
-    from GQLib.Models import LPPL, LPPLS
-
-@njit
+@njit(nogil=True, cache=True)
 def njit_initialize_population(param_bounds: np.ndarray, population_size: int) -> np.ndarray:
     """
     Initialize a population in nopython mode with Numba.
@@ -44,8 +41,8 @@ def njit_initialize_population(param_bounds: np.ndarray, population_size: int) -
     
     # return pop
 
-@njit
-def njit_selection(population: np.ndarray, fitness: np.ndarray) -> np.ndarray:
+@njit(nogil=True, cache=True)
+def njit_selection(population: np.ndarray, fitness: np.ndarray, out: np.ndarray) -> np.ndarray:
     """
     Tournament selection in nopython mode.
     
@@ -55,36 +52,28 @@ def njit_selection(population: np.ndarray, fitness: np.ndarray) -> np.ndarray:
         N individuals, each with D parameters.
     fitness : np.ndarray, shape (N,)
         Fitness (e.g., RSS) of each individual. Lower is better.
+    out : np.ndarray, shape (N, D)
+        Preallocated output buffer, must not overlap with population.
 
     Returns
     -------
     np.ndarray, shape (N, D)
-        The selected population of size N, after tournament selection.
+        The selected population of size N, after tournament selection (the out buffer).
     """
     n = population.shape[0]
-    num_params = population.shape[1]
-
-    selected = np.empty((n, num_params), dtype=np.float64)
 
     for k in range(n):
-        # Pick two random indices in [0, n)
-        i, j = np.random.randint(0, n, size=2)
-        
-        # Select the better chromosome (lower fitness)
+        # Pick two random indices in [0, n) and keep the better chromosome (lower fitness)
+        i = np.random.randint(0, n)
+        j = np.random.randint(0, n)
         if fitness[i] < fitness[j]:
-            selected[k, :] = population[i, :]
+            out[k, :] = population[i, :]
         else:
-            selected[k, :] = population[j, :]
-        # if fitness[i] < fitness[j]:
-        #     for col in range(num_params):
-        #         selected[k, col] = population[i, col]
-        # else:
-        #     for col in range(num_params):
-        #         selected[k, col] = population[j, col]
+            out[k, :] = population[j, :]
 
-    return selected
+    return out
 
-@njit
+@njit(nogil=True, cache=True)
 def njit_crossover(parents: np.ndarray, prob: float) -> np.ndarray:
     """
     Single-point crossover in nopython mode.
@@ -139,7 +128,7 @@ def njit_crossover(parents: np.ndarray, prob: float) -> np.ndarray:
             offspring[i, cp:], offspring[i+1, cp:] = parents[i+1, cp:], parents[i, cp:]  # Croisement en une ligne
     return offspring
 
-@njit
+@njit(nogil=True, cache=True)
 def njit_mutate(offspring: np.ndarray, prob: float, param_bounds: np.ndarray) -> np.ndarray:
     """
     Mutation operator in nopython mode.
@@ -171,11 +160,82 @@ def njit_mutate(offspring: np.ndarray, prob: float, param_bounds: np.ndarray) ->
 
     return offspring
 
-@njit
+@njit(nogil=True, cache=True)
+def njit_ga_step(population: np.ndarray, fitness: np.ndarray, crossover_prob: float,
+                 mutation_prob: float, param_bounds: np.ndarray, offspring: np.ndarray,
+                 offspring_fitness: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Selection, crossover and mutation fused in a single pass over the population.
+    Same operators as njit_selection, njit_crossover and njit_mutate, applied pair by pair
+    so that each offspring is written once.
+    Offspring left untouched by crossover and mutation are exact copies of their parent and
+    inherit its fitness, the others get a NaN fitness and must be re-evaluated.
+
+    Parameters
+    ----------
+    population : np.ndarray, shape (N, D)
+        N individuals, each with D parameters.
+    fitness : np.ndarray, shape (N,)
+        Fitness (e.g., RSS) of each individual. Lower is better.
+    crossover_prob : float
+        Probability of applying crossover to each pair.
+    mutation_prob : float
+        Mutation probability for each individual.
+    param_bounds : np.ndarray, shape (D, 2)
+        [low, high] bounds for each of the D parameters.
+    offspring : np.ndarray, shape (N, D)
+        Preallocated output buffer, must not overlap with population.
+    offspring_fitness : np.ndarray, shape (N,)
+        Preallocated output buffer for the inherited fitness (NaN for modified offspring).
+    rng : np.random.Generator
+        Random generator of the population, advanced in place.
+
+    Returns
+    -------
+    np.ndarray, shape (N, D)
+        The offspring buffer, filled in place.
+    """
+    n, d = population.shape
+
+    for k in range(0, n, 2):
+        last = min(k + 2, n)
+
+        # Tournament selection of the pair
+        for c in range(k, last):
+            i = rng.integers(0, n)
+            j = rng.integers(0, n)
+            if fitness[i] < fitness[j]:
+                offspring[c, :] = population[i, :]
+                offspring_fitness[c] = fitness[i]
+            else:
+                offspring[c, :] = population[j, :]
+                offspring_fitness[c] = fitness[j]
+
+        # Single-point crossover of the pair (the last individual of an odd population is kept)
+        if last - k == 2 and rng.random() < crossover_prob:
+            cp = rng.integers(1, d)
+            for col in range(cp, d):
+                tmp = offspring[k, col]
+                offspring[k, col] = offspring[k + 1, col]
+                offspring[k + 1, col] = tmp
+            offspring_fitness[k] = np.nan
+            offspring_fitness[k + 1] = np.nan
+
+        # Mutation of a random parameter
+        for c in range(k, last):
+            if rng.random() < mutation_prob:
+                mp = rng.integers(0, d)
+                offspring[c, mp] = rng.uniform(param_bounds[mp, 0], param_bounds[mp, 1])
+                offspring_fitness[c] = np.nan
+
+    return offspring
+
+@njit(nogil=True, cache=True)
 def njit_immigration_operation(populations: np.ndarray, fitness_values: np.ndarray) -> np.ndarray:
     """
-    Immigration operation in nopython mode.
+    Immigration operation in nopython mode, in place.
     The best individual of population m replaces the worst individual of population m+1.
+    The fitness of the replaced individual is updated accordingly.
     
     Parameters
     ----------
@@ -190,21 +250,66 @@ def njit_immigration_operation(populations: np.ndarray, fitness_values: np.ndarr
     np.ndarray, shape (M, N, D)
         Updated populations after immigration.
     """
-    # We assume populations.shape[0] = fitness_values.shape[0]
-    # and populations.shape[1] = fitness_values.shape[1]
-    for m in range(len(populations) - 1):
+    for m in range(populations.shape[0] - 1):
         best_idx = np.argmin(fitness_values[m])
-        worst_idx = np.argmax(fitness_values[m+1])
-        populations[m+1][worst_idx, :] = populations[m][best_idx, :]
-        # # Copy best chrom from pop m
-        # best_chrom = populations[m][best_idx]
-
-        # # Overwrite the worst in pop m+1
-        # populations[m+1][worst_idx] = best_chrom
+        worst_idx = np.argmax(fitness_values[m + 1])
+        populations[m + 1, worst_idx, :] = populations[m, best_idx, :]
+        fitness_values[m + 1, worst_idx] = fitness_values[m, best_idx]
     return populations
 
-@njit
-def njit_RSS_LPPL(chromosome: np.ndarray, data: np.ndarray) -> float:
+@njit(parallel=True, nogil=True, cache=True)
+def njit_step_all(populations: np.ndarray, fitness_values: np.ndarray, crossover_prob: np.ndarray,
+                  mutation_prob: np.ndarray, param_bounds: np.ndarray, t: np.ndarray, y: np.ndarray,
+                  offspring: np.ndarray, offspring_fitness: np.ndarray, cache_fitness: bool,
+                  rngs) -> None:
+    """
+    One MPGA generation, in place: selection, crossover, mutation and fitness of every
+    population, followed by the immigration operation.
+    Populations are independent until immigration, so they are spread over threads with prange.
+    Each population draws from its own random generator, so that the result does not
+    depend on the scheduling of the populations over the threads.
+
+    Parameters
+    ----------
+    populations : np.ndarray, shape (M, N, D)
+        The M populations, overwritten with the next generation.
+    fitness_values : np.ndarray, shape (M, N)
+        Fitness of each individual, overwritten with the fitness of the next generation.
+    crossover_prob : np.ndarray, shape (M,)
+        Crossover probability of each population.
+    mutation_prob : np.ndarray, shape (M,)
+        Mutation probability of each population.
+    param_bounds : np.ndarray, shape (D, 2)
+        [low, high] bounds for each of the D parameters.
+    t : np.ndarray, shape (J,)
+        The time points of the series.
+    y : np.ndarray, shape (J,)
+        The observed values of the series.
+    offspring : np.ndarray, shape (M, N, D)
+        Preallocated scratch buffer.
+    offspring_fitness : np.ndarray, shape (M, N)
+        Preallocated scratch buffer for the inherited fitness.
+    cache_fitness : bool
+        If True, only the offspring modified by crossover or mutation are re-evaluated,
+        the others keep the fitness of their parent. Otherwise every individual is re-evaluated.
+    rngs : numba.typed.List of np.random.Generator, length M
+        Random generator of each population, advanced in place.
+    """
+    num_populations, n = fitness_values.shape
+    for m in prange(num_populations):
+        njit_ga_step(populations[m], fitness_values[m], crossover_prob[m], mutation_prob[m],
+                     param_bounds, offspring[m], offspring_fitness[m], rngs[m])
+        populations[m, :, :] = offspring[m]
+        for i in range(n):
+            if cache_fitness and not np.isnan(offspring_fitness[m, i]):
+                fitness_values[m, i] = offspring_fitness[m, i]
+            else:
+                fitness_values[m, i] = njit_RSS(populations[m, i], t, y)
+
+    njit_immigration_operation(populations, fitness_values)
+
+@njit(nogil=True, cache=True)
+def njit_RSS_LPPL(chromosome: np.ndarray, t: np.ndarray, y: np.ndarray) -> float:
     """
     Compute the residual sum of squares (RSS) for the simplified LPPL model:
         y(t) ~ A + B * (t_c - t)^alpha + C * (t_c - t)^alpha * cos(omega ln(t_c - t) + phi).
@@ -213,36 +318,60 @@ def njit_RSS_LPPL(chromosome: np.ndarray, data: np.ndarray) -> float:
     ----------
     chromosome : np.ndarray, shape (4,)
         The nonlinear parameters: [t_c, omega, phi, alpha].
-    data : np.ndarray, shape (J, 2)
-        The time series data. data[:,0] = t, data[:,1] = y.
+    t : np.ndarray, shape (J,)
+        The time points of the series.
+    y : np.ndarray, shape (J,)
+        The observed values of the series.
 
     Returns
     -------
     float
         The RSS value of the fit. If the linear system is non-invertible, returns np.inf.
     """
-    y = data[:, 1]
-    t = data[:, 0]
     t_c, omega, phi, alpha = chromosome
+    n = t.shape[0]
+
+    # Single pass over the series: regressors and normal equations V^T V, V^T y
+    # of the design matrix V = [1, f, g], accumulated without building V
+    f = np.empty(n, dtype=np.float64)
+    g = np.empty(n, dtype=np.float64)
+    VtV = np.zeros((3, 3), dtype=np.float64)
+    Vty = np.zeros(3, dtype=np.float64)
+    for j in range(n):
+        dt = t_c - t[j]
+        fj = dt ** alpha
+        gj = fj * np.cos(omega * np.log(dt) + phi)
+        f[j] = fj
+        g[j] = gj
+        yj = y[j]
+        VtV[0, 1] += fj
+        VtV[0, 2] += gj
+        VtV[1, 1] += fj * fj
+        VtV[1, 2] += fj * gj
+        VtV[2, 2] += gj * gj
+        Vty[0] += yj
+        Vty[1] += fj * yj
+        Vty[2] += gj * yj
+    VtV[0, 0] = n
+    VtV[1, 0] = VtV[0, 1]
+    VtV[2, 0] = VtV[0, 2]
+    VtV[2, 1] = VtV[1, 2]
 
-    dt = t_c - t
-    f = dt ** alpha
-    g = f * np.cos(omega * np.log(dt) + phi)
-
-    # Build design matrix
-    V = np.column_stack((np.ones_like(f), f, g))
     # Attempt to invert (V^T V)
     try:
-        params = np.linalg.inv(V.T @ V) @ (V.T @ y)
+        params = np.linalg.inv(VtV) @ Vty
         A, B, C = params[0], params[1], params[2]
     except:
         return np.inf
 
-    predicted = A + B*f + C*g
-    return np.sum((y - predicted)**2)
+    rss = 0.0
+    for j in range(n):
+        r = y[j] - (A + B * f[j] + C * g[j])
+        rss += r * r
+    return rss
 
-@njit
-def njit_RSS_LPPLS(chromosome: np.ndarray, data: np.ndarray) -> float:
+@njit(nogil=True, cache=True)
+def njit_RSS_LPPLS(chromosome: np.ndarray, t: np.ndarray, y: np.ndarray) -> float:
     """
     Compute the residual sum of squares (RSS) for the simplified LPPL model:
         y(t) ~ A + B * (t_c - t)^alpha + C1 * (t_c - t)^alpha * cos(omega ln(t_c - t)) + C2 * (t_c - t)^alpha * sin(omega ln(t_c - t)).
@@ -251,68 +380,243 @@ def njit_RSS_LPPLS(chromosome: np.ndarray, data: np.ndarray) -> float:
     ----------
     chromosome : np.ndarray, shape (3,)
         The nonlinear parameters: [t_c, omega, alpha].
-    data : np.ndarray, shape (J, 2)
-        The time series data. data[:,0] = t, data[:,1] = y.
+    t : np.ndarray, shape (J,)
+        The time points of the series.
+    y : np.ndarray, shape (J,)
+        The observed values of the series.
 
     Returns
     -------
     float
         The RSS value of the fit. If the linear system is non-invertible, returns np.inf.
     """
-    y = data[:, 1]
-    t = data[:, 0]
     t_c, omega, alpha = chromosome
+    n = t.shape[0]
+
+    # Single pass over the series: regressors and normal equations V^T V, V^T y
+    # of the design matrix V = [1, f, g, h], accumulated without building V
+    f = np.empty(n, dtype=np.float64)
+    g = np.empty(n, dtype=np.float64)
+    h = np.empty(n, dtype=np.float64)
+    VtV = np.zeros((4, 4), dtype=np.float64)
+    Vty = np.zeros(4, dtype=np.float64)
+    for j in range(n):
+        dt = t_c - t[j]
+        fj = dt ** alpha
+        log_dt = np.log(dt)
+        gj = fj * np.cos(omega * log_dt)
+        hj = fj * np.sin(omega * log_dt)
+        f[j] = fj
+        g[j] = gj
+        h[j] = hj
+        yj = y[j]
+        VtV[0, 1] += fj
+        VtV[0, 2] += gj
+        VtV[0, 3] += hj
+        VtV[1, 1] += fj * fj
+        VtV[1, 2] += fj * gj
+        VtV[1, 3] += fj * hj
+        VtV[2, 2] += gj * gj
+        VtV[2, 3] += gj * hj
+        VtV[3, 3] += hj * hj
+        Vty[0] += yj
+        Vty[1] += fj * yj
+        Vty[2] += gj * yj
+        Vty[3] += hj * yj
+    VtV[0, 0] = n
+    for r in range(1, 4):
+        for c in range(r):
+            VtV[r, c] = VtV[c, r]
 
-    dt = t_c - t
-    f = dt ** alpha
-    g = f * np.cos(omega * np.log(dt))
-    h = f * np.sin(omega * np.log(dt))
-
-    # Build design matrix
-    V = np.column_stack((np.ones_like(f), f, g, h))
     # Attempt to invert (V^T V)
     try:
-        params = np.linalg.inv(V.T @ V) @ (V.T @ y)
+        params = np.linalg.inv(VtV) @ Vty
         A, B, C1, C2 = params[0], params[1], params[2], params[3]
     except:
         return np.inf
 
-    predicted = A + B*f + C1*g + C2*h
-    return np.sum((y - predicted)**2)
+    rss = 0.0
+    for j in range(n):
+        r = y[j] - (A + B * f[j] + C1 * g[j] + C2 * h[j])
+        rss += r * r
+    return rss
+
+@njit(nogil=True, cache=True)
+def njit_RSS(chromosome: np.ndarray, t: np.ndarray, y: np.ndarray) -> float:
+    """
+    Compute the RSS of a chromosome with the model matching its number of parameters:
+    4 parameters [t_c, omega, phi, alpha] for LPPL, 3 parameters [t_c, omega, alpha] for LPPLS.
+
+    The kernels of the optimizers call this function instead of receiving the model RSS as an
+    argument, because Numba cannot cache functions taking other functions as arguments.
+
+    Parameters
+    ----------
+    chromosome : np.ndarray, shape (4,) or (3,)
+        The nonlinear parameters of the model.
+    t : np.ndarray, shape (J,)
+        The time points of the series.
+    y : np.ndarray, shape (J,)
+        The observed values of the series.
+
+    Returns
+    -------
+    float
+        The RSS value of the fit.
+    """
+    if chromosome.shape[0] == 4:
+        return njit_RSS_LPPL(chromosome, t, y)
+    return njit_RSS_LPPLS(chromosome, t, y)
 
-def njit_calculate_fitness(population: np.ndarray, data: np.ndarray, lppl_model: 'LPPL | LPPLS') -> np.ndarray:
+@njit(parallel=True, nogil=True, cache=True)
+def njit_calculate_fitness(population: np.ndarray, t: np.ndarray, y: np.ndarray) -> np.ndarray:
     """
     Calculate the fitness (RSS) for each chromosome in the population.
+    Chromosomes are independent, so the loop is spread over threads with prange.
 
     Parameters
     ----------
     population : np.ndarray, shape (N, 4)
         Each row is a chromosome [t_c, alpha, omega, phi].
-    data : np.ndarray, shape (J, 2)
-        The time series, where data[:,0] = t, data[:,1] = y.
+    t : np.ndarray, shape (J,)
+        The time points of the series.
+    y : np.ndarray, shape (J,)
+        The observed values of the series.
 
     Returns
     -------
     np.ndarray, shape (N,)
         The RSS of each individual in the population.
     """
-    n = len(population)
+    n = population.shape[0]
     fitness = np.empty(n, dtype=np.float64)
-    for i in range(n):
-        fitness[i] = lppl_model.numba_RSS(population[i], data)
+    for i in prange(n):
+        fitness[i] = njit_RSS(population[i], t, y)
+    return fitness
+
+@njit(parallel=True, nogil=True, cache=True)
+def njit_update_fitness(population: np.ndarray, fitness: np.ndarray, t: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Evaluate, in place, the fitness of the individuals whose fitness is NaN.
+    Used with the inherited fitness filled by njit_ga_step.
+
+    Parameters
+    ----------
+    population : np.ndarray, shape (N, D)
+        N individuals, each with D parameters.
+    fitness : np.ndarray, shape (N,)
+        Fitness of each individual, NaN for the ones to evaluate.
+    t : np.ndarray, shape (J,)
+        The time points of the series.
+    y : np.ndarray, shape (J,)
+        The observed values of the series.
+
+    Returns
+    -------
+    np.ndarray, shape (N,)
+        The fitness array, updated in place.
+    """
+    for i in prange(population.shape[0]):
+        if np.isnan(fitness[i]):
+            fitness[i] = njit_RSS(population[i], t, y)
     return fitness
 
-@njit
-def njit_update_velocity(current_velocity: np.ndarray, current_position: np.ndarray, local_min_position: np.ndarray, 
-                         global_best_position: np.ndarray, w: float, c1: float, c2: float) -> np.ndarray:
+# Number of SA iterations covered by each batch of random perturbations
+SA_NOISE_BATCH = 1024
+
+@njit(nogil=True, cache=True, error_model="numpy")
+def njit_simulated_annealing(param_bounds: np.ndarray, t: np.ndarray, y: np.ndarray,
+                             max_iter: int, initial_temp: float, cooling_rate: float):
+    """
+    Simulated Annealing main loop in nopython mode.
+    The iteration counter is reset each time the best solution improves, and the loop
+    stops after max_iter iterations without improvement.
+
+    Parameters
+    ----------
+    param_bounds : np.ndarray, shape (D, 2)
+        [low, high] bounds for each of the D parameters.
+    t : np.ndarray, shape (J,)
+        The time points of the series.
+    y : np.ndarray, shape (J,)
+        The observed values of the series.
+    max_iter : int
+        Number of iterations without improvement before stopping.
+    initial_temp : float
+        Initial temperature.
+    cooling_rate : float
+        Multiplicative decay of the temperature at each iteration.
+
+    Returns
+    -------
+    Tuple[float, np.ndarray, list]
+        Best RSS, best solution of shape (D,) and the RSS of every accepted solution.
     """
-    Update the velocity of a particle in a swarm optimization process.
+    d = param_bounds.shape[0]
+    lows = param_bounds[:, 0].copy()
+    highs = param_bounds[:, 1].copy()
+    scales = 0.1 * (highs - lows)
+
+    # Initialize the current solution randomly within parameter bounds
+    current_solution = lows + np.random.random(d) * (highs - lows)
+    current_fitness = njit_RSS(current_solution, t, y)
+    best_solution = current_solution.copy()
+    best_fitness = current_fitness
+    history = [current_fitness]
+
+    temperature = initial_temp
+    candidate_solution = np.empty(d, dtype=np.float64)
+
+    # Gaussian perturbations are drawn by batches of SA_NOISE_BATCH iterations
+    noise = np.empty((0, d), dtype=np.float64)
+    k = SA_NOISE_BATCH
+
+    current = 0
+    while current <= max_iter:
+        if k == SA_NOISE_BATCH:
+            noise = np.random.standard_normal((SA_NOISE_BATCH, d))
+            k = 0
+
+        # Generate a new candidate solution by making small perturbations
+        for i in range(d):
+            candidate_solution[i] = min(max(current_solution[i] + scales[i] * noise[k, i], lows[i]), highs[i])
+        k += 1
+
+        candidate_fitness = njit_RSS(candidate_solution, t, y)
+
+        # Metropolis acceptance (the exponential is only evaluated for worse candidates)
+        accept = (candidate_fitness < current_fitness
+                  or np.random.random() < math.exp(-(candidate_fitness - current_fitness) / temperature))
+        if accept:
+            current_solution[:] = candidate_solution
+            current_fitness = candidate_fitness
+            history.append(current_fitness)
+
+        # Track the best solution
+        if current_fitness < best_fitness:
+            best_solution[:] = current_solution
+            best_fitness = current_fitness
+            current = 0
+
+        current += 1
+
+        # Cooling schedule: Gradually reduce the temperature
+        temperature *= cooling_rate
+
+    return best_fitness, best_solution, history
+
+@njit(nogil=True, cache=True)
+def njit_update_velocity(velocity: np.ndarray, position: np.ndarray, local_min_position: np.ndarray,
+                         global_best_position: np.ndarray, w: float, c1: float, c2: float,
+                         r1: float, r2: float) -> None:
+    """
+    Update the velocity of a particle in a swarm optimization process, in place.
 
     Parameters
     ----------
-    current_velocity : np.ndarray
-        Current velocity of the particle.
-    current_position : np.ndarray
+    velocity : np.ndarray
+        Current velocity of the particle, overwritten with the new velocity.
+    position : np.ndarray
         Current position of the particle.
     local_min_position : np.ndarray
         Best position found by the particle.
@@ -324,40 +628,161 @@ def njit_update_velocity(current_velocity: np.ndarray, current_position: np.ndar
         Cognitive coefficient.
     c2 : float
         Social coefficient.
+    r1 : float
+        Uniform random factor of the cognitive term.
+    r2 : float
+        Uniform random factor of the social term.
+    """
+    for k in range(velocity.shape[0]):
+        velocity[k] = (w * velocity[k]
+                       + r1 * c1 * (local_min_position[k] - position[k])
+                       + r2 * c2 * (global_best_position[k] - position[k]))
 
-    Returns
-    -------
-    np.ndarray
-        Updated velocity of the particle.
+@njit(nogil=True, cache=True)
+def njit_update_position(position: np.ndarray, velocity: np.ndarray, param_bounds: np.ndarray) -> None:
+    """
+    Update the position of the particle with its velocity, in place.
+    The particle is stopped at the bounds: the position is clipped and the velocity
+    set to zero along the dimensions where a bound is hit.
+
+    Parameters
+    ----------
+    position : np.ndarray
+        Current position of the particle, overwritten with the new position.
+    velocity : np.ndarray
+        New velocity of the particle, set to zero where a bound is hit.
+    param_bounds : np.ndarray, shape (D, 2)
+        Rows correspond to each parameter [low, high].
+        For instance, if we have 4 parameters:
+            param_bounds[0] = [t_c_min, t_c_max]
+            param_bounds[1] = [omega_min, omega_max]
+            param_bounds[2] = [phi_min, phi_max]
+            param_bounds[3] = [alpha_min, alpha_max]
+    """
+    for k in range(position.shape[0]):
+        p = position[k] + velocity[k]
+        if p < param_bounds[k, 0]:
+            p = param_bounds[k, 0]
+            velocity[k] = 0.0
+        elif p > param_bounds[k, 1]:
+            p = param_bounds[k, 1]
+            velocity[k] = 0.0
+        position[k] = p
+
+@njit(parallel=True, nogil=True, cache=True)
+def njit_pso_step(positions: np.ndarray, velocities: np.ndarray, local_best_positions: np.ndarray,
+                  local_best_fitness: np.ndarray, global_best_position: np.ndarray, param_bounds: np.ndarray,
+                  w: float, c1: float, c2: float, r1: np.ndarray, r2: np.ndarray,
+                  t: np.ndarray, y: np.ndarray) -> None:
     """
-    r1, r2 = np.random.uniform(0, 1, size=2)  # Random factors
-    new_velocity = w * current_velocity + r1 * c1 * (local_min_position - current_position) + r2 * c2 * (global_best_position - current_position)
-    return new_velocity
+    Move the whole swarm by one generation, in place, with njit_update_velocity and
+    njit_update_position applied to every particle.
+    Each particle is moved, evaluated and its local best updated in the same pass,
+    the particles being spread over threads with prange.
 
-@njit
-def njit_update_position(new_velocity: np.ndarray, current_position: np.ndarray, param_bounds: np.ndarray) -> np.ndarray:
+    Parameters
+    ----------
+    positions : np.ndarray, shape (N, D)
+        Position of each particle, overwritten with the new positions.
+    velocities : np.ndarray, shape (N, D)
+        Velocity of each particle, overwritten with the new velocities.
+    local_best_positions : np.ndarray, shape (N, D)
+        Best position found by each particle, updated in place.
+    local_best_fitness : np.ndarray, shape (N,)
+        Fitness of the best position found by each particle, updated in place.
+    global_best_position : np.ndarray, shape (D,)
+        Best position found by the swarm.
+    param_bounds : np.ndarray, shape (D, 2)
+        [low, high] bounds for each of the D parameters.
+    w : float
+        Inertia weight.
+    c1 : float
+        Cognitive coefficient.
+    c2 : float
+        Social coefficient.
+    r1 : np.ndarray, shape (N,)
+        Uniform random factor of the cognitive term, for each particle.
+    r2 : np.ndarray, shape (N,)
+        Uniform random factor of the social term, for each particle.
+    t : np.ndarray, shape (J,)
+        The time points of the series.
+    y : np.ndarray, shape (J,)
+        The observed values of the series.
+    """
+    n = positions.shape[0]
+    for i in prange(n):
+        njit_update_velocity(velocities[i], positions[i], local_best_positions[i], global_best_position,
+                             w, c1, c2, r1[i], r2[i])
+        njit_update_position(positions[i], velocities[i], param_bounds)
+
+        fitness = njit_RSS(positions[i], t, y)
+        if fitness < local_best_fitness[i]:
+            local_best_fitness[i] = fitness
+            local_best_positions[i, :] = positions[i, :]
+
+@njit(nogil=True, cache=True)
+def njit_pso_run(positions: np.ndarray, param_bounds: np.ndarray, w: float, c1: float, c2: float,
+                 t: np.ndarray, y: np.ndarray, max_gen: int, rng: np.random.Generator):
     """
-    Update the position of the particule with the new velocity.
+    Particle Swarm Optimisation main loop in nopython mode.
+    The swarm is moved with njit_pso_step for max_gen + 1 generations, starting at rest.
 
     Parameters
-        ----------
-        new_velocity : np.ndarray
-            New velocity of the particle.
-        current_position : np.ndarray
-            Current position of the particle.
-        param_bounds : np.ndarray, shape (D, 2)
-            Rows correspond to each parameter [low, high].
-            For instance, if we have 4 parameters:
-                param_bounds[0] = [t_c_min, t_c_max]
-                param_bounds[1] = [omega_min, omega_max]
-                param_bounds[2] = [phi_min, phi_max]
-                param_bounds[3] = [alpha_min, alpha_max]
-    """
-    updated_position = current_position + new_velocity
-
-    for i in range(len(updated_position)):
-        lower_bound, upper_bound = param_bounds[i]
-        updated_position[i] = max(lower_bound, min(updated_position[i], upper_bound))
-
-    return updated_position
+    ----------
+    positions : np.ndarray, shape (N, D)
+        Initial position of each particle, updated in place.
+    param_bounds : np.ndarray, shape (D, 2)
+        [low, high] bounds for each of the D parameters.
+    w : float
+        Inertia weight.
+    c1 : float
+        Cognitive coefficient.
+    c2 : float
+        Social coefficient.
+    t : np.ndarray, shape (J,)
+        The time points of the series.
+    y : np.ndarray, shape (J,)
+        The observed values of the series.
+    max_gen : int
+        Index of the last generation.
+    rng : np.random.Generator
+        Random generator drawing the r1, r2 factors, advanced in place.
 
+    Returns
+    -------
+    Tuple[float, np.ndarray, np.ndarray]
+        Best RSS, best position of shape (D,) and the best RSS after each generation,
+        of shape (max_gen + 2,) (the first value is the one of the initial swarm).
+    """
+    n = positions.shape[0]
+    velocities = np.zeros_like(positions)
+
+    # Initialize particles (local) best positions and best fitness associated
+    local_best_positions = positions.copy()
+    local_best_fitness = njit_calculate_fitness(positions, t, y)
+
+    # Initial global best particle
+    best_idx = np.argmin(local_best_fitness)
+    global_best_fitness = local_best_fitness[best_idx]
+    global_best_position = local_best_positions[best_idx].copy()
+    history = np.empty(max_gen + 2, dtype=np.float64)
+    history[0] = global_best_fitness
+
+    r1 = np.empty(n, dtype=np.float64)
+    r2 = np.empty(n, dtype=np.float64)
+    for gen in range(max_gen + 1):
+        for i in range(n):
+            r1[i] = rng.random()
+            r2[i] = rng.random()
+        # Move the particles and update their best positions
+        njit_pso_step(positions, velocities, local_best_positions, local_best_fitness, global_best_position,
+                      param_bounds, w, c1, c2, r1, r2, t, y)
+
+        # Update the global best particle
+        best_idx = np.argmin(local_best_fitness)
+        history[gen + 1] = local_best_fitness[best_idx]
+        if local_best_fitness[best_idx] < global_best_fitness:
+            global_best_fitness = local_best_fitness[best_idx]
+            global_best_position[:] = local_best_positions[best_idx]
+
+    return global_best_fitness, global_best_position, history